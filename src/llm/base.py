@@ -9,7 +9,7 @@ from dataclasses import dataclass, field
 from typing import Any, Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolDefinition:
     """LLMに渡すツール定義（プロバイダー非依存の中間表現）."""
 
@@ -18,7 +18,7 @@ class ToolDefinition:
     input_schema: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """LLMが要求するツール呼び出し."""
 
@@ -27,7 +27,7 @@ class ToolCall:
     arguments: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """ツール実行結果."""
 
@@ -36,7 +36,7 @@ class ToolResult:
     is_error: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """LLMに送る1メッセージ."""
 
@@ -46,7 +46,7 @@ class Message:
     tool_calls: list[ToolCall] = field(default_factory=list)  # role="assistant" 時: LLMが要求するツール呼び出し
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """LLMからの応答."""
 
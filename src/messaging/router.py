@@ -42,6 +42,16 @@ _RAG_KEYWORDS = ("rag",)
 _STATUS_KEYWORDS = ("status", "info")
 
 
+def _compile_command_pattern(keywords: tuple[str, ...]) -> re.Pattern[str]:
+    """いずれかのキーワードで始まるコマンドにマッチする正規表現を生成する."""
+    return re.compile(rf"^(?:{'|'.join(map(re.escape, keywords))})\b")
+
+
+# メッセージごとに再生成しないようモジュールロード時にコンパイルしておく
+_FEED_COMMAND_RE = _compile_command_pattern(_FEED_KEYWORDS)
+_RAG_COMMAND_RE = _compile_command_pattern(_RAG_KEYWORDS)
+
+
 def _parse_rag_command(text: str) -> tuple[str, str, str, str]:
     """ragコマンドを解析する."""
     tokens = text.split()
@@ -547,16 +557,12 @@ class MessageRouter:
 
         # feedコマンド (F2-AC7, F6-AC4)
         lower_text = cleaned_text.lower().lstrip()
-        if self._collector is not None and any(
-            re.match(rf"^{re.escape(kw)}\b", lower_text) for kw in _FEED_KEYWORDS
-        ):
+        if self._collector is not None and _FEED_COMMAND_RE.match(lower_text):
             await self._handle_feed_command(msg, cleaned_text, lower_text)
             return
 
         # ragコマンド (F9)
-        if self._mcp_manager is not None and any(
-            re.match(rf"^{re.escape(kw)}\b", lower_text) for kw in _RAG_KEYWORDS
-        ):
+        if self._mcp_manager is not None and _RAG_COMMAND_RE.match(lower_text):
             await self._handle_rag_command(msg, cleaned_text)
             return
 
@@ -37,7 +37,7 @@ _BM25_HEADER_RE = re.compile(r"###\s+Result\s+\d+\s+\[score=(\d+(?:\.\d+)?)\]")
 RagEngineType = Literal["vector", "bm25", "unknown"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RagSource:
     """RAG検索のソース情報（参照元表示用）."""
 
@@ -276,16 +276,14 @@ class ChatService:
         if not auto_tools:
             return sources, applied
 
-        for tool_name in auto_tools:
-            try:
-                result = await asyncio.wait_for(
-                    self._mcp_manager.call_tool(tool_name, {"query": user_text}),
-                    timeout=TOOL_CALL_TIMEOUT_SEC,
-                )
-            except Exception:
-                logger.debug("Auto-context tool '%s' failed", tool_name, exc_info=True)
-                continue
+        # 各ツールは互いに独立しているため並行実行する（注入順は設定順を維持）
+        results = await asyncio.gather(
+            *(self._call_auto_context_tool(name, user_text) for name in auto_tools)
+        )
 
+        # 注入ブロック（検索結果 + response_instruction）を集めて最後に一度だけ結合する
+        blocks: list[str] = []
+        for tool_name, result in zip(auto_tools, results, strict=True):
             if not result or "該当する情報が見つかりませんでした" in result:
                 continue
 
@@ -293,30 +291,42 @@ class ChatService:
             sources.extend(_parse_rag_sources_from_text(result, seen))
 
             # 検索結果をシステムプロンプトに注入
-            context_block = (
+            blocks.append(
                 "以下は質問に関連する参考情報です。"
                 "回答に役立つ場合は活用してください:\n" + result
             )
-            if messages and messages[0].role == "system":
-                messages[0] = Message(
-                    role="system",
-                    content=messages[0].content + "\n\n" + context_block,
-                )
-            else:
-                messages.insert(0, Message(role="system", content=context_block))
 
             # 対応する response_instruction も適用（重複防止）
             instruction = self._mcp_manager.get_response_instruction(tool_name)
             if instruction and instruction not in applied:
                 applied.add(instruction)
-                if messages and messages[0].role == "system":
-                    messages[0] = Message(
-                        role="system",
-                        content=messages[0].content + "\n\n" + instruction,
-                    )
+                blocks.append(instruction)
+
+        if blocks:
+            context = "\n\n".join(blocks)
+            if messages and messages[0].role == "system":
+                messages[0] = Message(
+                    role="system",
+                    content=messages[0].content + "\n\n" + context,
+                )
+            else:
+                messages.insert(0, Message(role="system", content=context))
 
         return sources, applied
 
+    async def _call_auto_context_tool(self, tool_name: str, user_text: str) -> str | None:
+        """自動コンテキストツールを呼び出す. 失敗・タイムアウト時は None を返す."""
+        if self._mcp_manager is None:
+            return None
+        try:
+            return await asyncio.wait_for(
+                self._mcp_manager.call_tool(tool_name, {"query": user_text}),
+                timeout=TOOL_CALL_TIMEOUT_SEC,
+            )
+        except Exception:
+            logger.debug("Auto-context tool '%s' failed", tool_name, exc_info=True)
+            return None
+
     @staticmethod
     def _extract_rag_sources_from_messages(messages: list[Message]) -> list[RagSource]:
         """ツールループ内の rag_search 結果からソース情報を抽出する.
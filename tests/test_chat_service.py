@@ -23,10 +23,16 @@ async def db_session_factory():  # type: ignore[no-untyped-def]
     await engine.dispose()
 
 
+def _make_llm(content: str) -> AsyncMock:
+    """complete() が指定テキストを返すモックLLMを作成する."""
+    llm = AsyncMock()
+    llm.complete.return_value = LLMResponse(content=content)
+    return llm
+
+
 async def test_conversation_history_maintained(db_session_factory) -> None:  # type: ignore[no-untyped-def]
     """同一スレッド内の会話履歴を保持し文脈を踏まえた応答ができる."""
-    llm = AsyncMock()
-    llm.complete.return_value = LLMResponse(content="回答1")
+    llm = _make_llm("回答1")
 
     service = ChatService(llm=llm, session_factory=db_session_factory, system_prompt="テスト")
 
@@ -45,8 +51,7 @@ async def test_conversation_history_maintained(db_session_factory) -> None:  # t
 
 async def test_system_prompt_reflected(db_session_factory) -> None:  # type: ignore[no-untyped-def]
     """性格設定がシステムプロンプトに反映される."""
-    llm = AsyncMock()
-    llm.complete.return_value = LLMResponse(content="応答")
+    llm = _make_llm("応答")
 
     service = ChatService(llm=llm, session_factory=db_session_factory, system_prompt="優しい口調で")
 
@@ -59,8 +64,7 @@ async def test_system_prompt_reflected(db_session_factory) -> None:  # type: ign
 
 async def test_llm_response_generated(db_session_factory) -> None:  # type: ignore[no-untyped-def]
     """LLMで応答を生成する."""
-    llm = AsyncMock()
-    llm.complete.return_value = LLMResponse(content="LLM応答")
+    llm = _make_llm("LLM応答")
 
     service = ChatService(llm=llm, session_factory=db_session_factory)
     result = await service.respond(user_id="U1", text="test", thread_ts="t1")
@@ -71,8 +75,7 @@ async def test_llm_response_generated(db_session_factory) -> None:  # type: igno
 
 async def test_conversation_saved_to_db(db_session_factory) -> None:  # type: ignore[no-untyped-def]
     """会話履歴をDBに保存する."""
-    llm = AsyncMock()
-    llm.complete.return_value = LLMResponse(content="保存テスト")
+    llm = _make_llm("保存テスト")
 
     service = ChatService(llm=llm, session_factory=db_session_factory)
     await service.respond(user_id="U1", text="入力", thread_ts="t1")
@@ -91,8 +94,7 @@ async def test_conversation_saved_to_db(db_session_factory) -> None:  # type: ig
 
 async def test_non_thread_uses_db_history(db_session_factory) -> None:  # type: ignore[no-untyped-def]
     """スレッド外ではDB履歴を使用する."""
-    llm = AsyncMock()
-    llm.complete.return_value = LLMResponse(content="回答")
+    llm = _make_llm("回答")
 
     thread_history_fetcher = AsyncMock()
 
@@ -114,8 +116,7 @@ async def test_non_thread_uses_db_history(db_session_factory) -> None:  # type:
 
 async def test_fallback_to_db_on_api_failure(db_session_factory) -> None:  # type: ignore[no-untyped-def]
     """Slack API 失敗時に DB フォールバック."""
-    llm = AsyncMock()
-    llm.complete.return_value = LLMResponse(content="fallback回答")
+    llm = _make_llm("fallback回答")
 
     thread_history_fetcher = AsyncMock()
     thread_history_fetcher.return_value = None  # API 失敗
@@ -137,8 +138,7 @@ async def test_fallback_to_db_on_api_failure(db_session_factory) -> None:  # typ
 
 async def test_auto_reply_channel_thread_uses_slack_api_history(db_session_factory) -> None:  # type: ignore[no-untyped-def]
     """自動返信チャンネルのスレッド内でもスレッド履歴が使用される."""
-    llm = AsyncMock()
-    llm.complete.return_value = LLMResponse(content="thread回答")
+    llm = _make_llm("thread回答")
 
     thread_history_fetcher = AsyncMock()
     thread_history_fetcher.return_value = [
@@ -167,8 +167,7 @@ async def test_auto_reply_channel_thread_uses_slack_api_history(db_session_facto
 
 async def test_thread_uses_slack_api_history(db_session_factory) -> None:  # type: ignore[no-untyped-def]
     """スレッド内で Slack API 履歴が使用される."""
-    llm = AsyncMock()
-    llm.complete.return_value = LLMResponse(content="応答")
+    llm = _make_llm("応答")
 
     thread_history_fetcher = AsyncMock()
     thread_history_fetcher.return_value = [
@@ -5,13 +5,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from src.db.models import Base
-from src.llm.base import LLMProvider, LLMResponse, ToolCall, ToolDefinition
+from src.config.settings import Settings
+from src.db.models import Base, Conversation
+from src.llm.base import LLMProvider, LLMResponse, Message, ToolCall, ToolDefinition
 from src.services.chat import TOOL_LOOP_MAX_ITERATIONS, ChatService, RagSource
 
 
@@ -26,6 +32,13 @@ async def session_factory() -> async_sessionmaker[AsyncSession]:
     return factory
 
 
+@pytest.fixture
+def rag_show_sources_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """rag_show_sources を有効にした設定に差し替える."""
+    mock_settings = SimpleNamespace(rag_show_sources=True)
+    monkeypatch.setattr("src.services.chat.get_settings", lambda: mock_settings)
+
+
 def _make_mock_llm(
     text_response: str = "テスト応答",
     tool_calls: list[ToolCall] | None = None,
@@ -197,12 +210,8 @@ async def test_mcp_disabled_mode(
 
 
 @pytest.mark.asyncio
-async def test_mcp_server_config_changes() -> None:
+async def test_mcp_server_config_changes(tmp_path: Path) -> None:
     """config/mcp_servers.json でMCPサーバーの追加・変更が可能であること."""
-    import json
-    import tempfile
-    from pathlib import Path
-
     from src.main import _load_mcp_server_configs
 
     # テスト用の設定ファイルを作成
@@ -221,25 +230,20 @@ async def test_mcp_server_config_changes() -> None:
             },
         }
     }
+    config_path = tmp_path / "mcp_servers.json"
+    config_path.write_text(json.dumps(config_data), encoding="utf-8")
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False, encoding="utf-8") as f:
-        json.dump(config_data, f)
-        temp_path = f.name
-
-    try:
-        configs = _load_mcp_server_configs(temp_path)
-        assert len(configs) == 2
+    configs = _load_mcp_server_configs(str(config_path))
+    assert len(configs) == 2
 
-        weather_config = next(c for c in configs if c.name == "weather")
-        assert weather_config.transport == "stdio"
-        assert weather_config.command == "python"
-        assert weather_config.args == ["weather_server.py"]
-        assert weather_config.env == {"API_KEY": "test"}
+    weather_config = next(c for c in configs if c.name == "weather")
+    assert weather_config.transport == "stdio"
+    assert weather_config.command == "python"
+    assert weather_config.args == ["weather_server.py"]
+    assert weather_config.env == {"API_KEY": "test"}
 
-        calc_config = next(c for c in configs if c.name == "calculator")
-        assert calc_config.command == "python"
-    finally:
-        Path(temp_path).unlink()
+    calc_config = next(c for c in configs if c.name == "calculator")
+    assert calc_config.command == "python"
 
 
 @pytest.mark.asyncio
@@ -251,24 +255,26 @@ async def test_missing_config_file() -> None:
     assert configs == []
 
 
-def test_mcp_enabled_env_control(monkeypatch: pytest.MonkeyPatch) -> None:
+@pytest.mark.parametrize(
+    ("env_value", "expected"),
+    [
+        # デフォルト: 無効
+        pytest.param(None, False, id="default"),
+        pytest.param("true", True, id="enabled"),
+        pytest.param("false", False, id="disabled"),
+    ],
+)
+def test_mcp_enabled_env_control(
+    env_value: str | None, expected: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """MCP_ENABLED 環境変数でMCP機能のON/OFFを制御できること."""
-    from src.config.settings import Settings
-
-    # デフォルト: 無効 (_env_file=Noneで.envファイルの影響を排除)
-    monkeypatch.delenv("MCP_ENABLED", raising=False)
-    settings = Settings(_env_file=None)
-    assert settings.mcp_enabled is False
-
-    # 有効化
-    monkeypatch.setenv("MCP_ENABLED", "true")
-    settings = Settings(_env_file=None)
-    assert settings.mcp_enabled is True
-
-    # 無効化
-    monkeypatch.setenv("MCP_ENABLED", "false")
+    if env_value is None:
+        monkeypatch.delenv("MCP_ENABLED", raising=False)
+    else:
+        monkeypatch.setenv("MCP_ENABLED", env_value)
+    # _env_file=Noneで.envファイルの影響を排除
     settings = Settings(_env_file=None)
-    assert settings.mcp_enabled is False
+    assert settings.mcp_enabled is expected
 
 
 @pytest.mark.asyncio
@@ -313,10 +319,6 @@ async def test_chat_with_tools_saves_only_final_response(
     session_factory: async_sessionmaker[AsyncSession],
 ) -> None:
     """ツール呼び出しの中間ステップはDBに保存されず、最終応答のみ保存されること."""
-    from sqlalchemy import select
-
-    from src.db.models import Conversation
-
     tool_calls = [
         ToolCall(id="call_1", name="get_weather", arguments={"location": "東京"}),
     ]
@@ -376,8 +378,6 @@ class TestExtractRagSourcesFromMessages:
 
     def test_extracts_source_urls_from_tool_messages(self) -> None:
         """ツールメッセージから検索エンジン種別・スコア・URLを抽出すること."""
-        from src.llm.base import Message
-
         messages = [
             Message(role="user", content="テスト"),
             Message(role="assistant", content=""),
@@ -410,8 +410,6 @@ class TestExtractRagSourcesFromMessages:
 
     def test_returns_empty_when_no_tool_messages(self) -> None:
         """ツールメッセージがない場合は空リストを返すこと."""
-        from src.llm.base import Message
-
         messages = [
             Message(role="user", content="こんにちは"),
             Message(role="assistant", content="こんにちは！"),
@@ -422,8 +420,6 @@ class TestExtractRagSourcesFromMessages:
 
     def test_returns_empty_when_no_source_in_tool_message(self) -> None:
         """ツールメッセージに Source: がない場合は空リストを返すこと."""
-        from src.llm.base import Message
-
         messages = [
             Message(
                 role="tool",
@@ -437,8 +433,6 @@ class TestExtractRagSourcesFromMessages:
 
     def test_deduplicates_same_engine_source_urls(self) -> None:
         """同一エンジン・同一URLの重複は1つにまとめること."""
-        from src.llm.base import Message
-
         messages = [
             Message(
                 role="tool",
@@ -461,8 +455,6 @@ class TestExtractRagSourcesFromMessages:
 
     def test_extracts_source_urls_with_hash_prefix(self) -> None:
         """'## Source: ' プレフィックスも処理できること."""
-        from src.llm.base import Message
-
         messages = [
             Message(
                 role="tool",
@@ -481,17 +473,31 @@ class TestExtractRagSourcesFromMessages:
         ]
 
 
-@pytest.mark.asyncio
-async def test_rag_sources_from_tool_loop(
+# rag_search ツールが返す検索結果テキスト
+_RAG_VECTOR_RESULT = (
+    "## ベクトル検索結果 (意味的類似度)\n\n"
+    "### Result 1 [distance=0.234]\n"
+    "Source: https://example.com/page1\n"
+    "関連テキスト"
+)
+_RAG_BM25_RESULT = (
+    "## BM25検索結果 (キーワード一致)\n\n"
+    "### Result 1 [score=4.521]\n"
+    "Source: https://example.com/page2\n"
+    "BM25テキスト"
+)
+
+
+def _make_rag_search_service(
     session_factory: async_sessionmaker[AsyncSession],
-) -> None:
-    """ツールループで rag_search が呼ばれた場合、ソースURLが抽出されること."""
-    tool_calls = [
-        ToolCall(id="call_1", name="rag_search", arguments={"query": "テスト"}),
-    ]
+    call_result: str,
+) -> ChatService:
+    """ツールループで rag_search を1回呼び出す ChatService を作成する."""
     mock_llm = _make_mock_llm(
         text_response="ナレッジベースによると...",
-        tool_calls=tool_calls,
+        tool_calls=[
+            ToolCall(id="call_1", name="rag_search", arguments={"query": "テスト"}),
+        ],
     )
     mock_mcp = _make_mock_mcp_manager(
         tools=[
@@ -501,27 +507,26 @@ async def test_rag_sources_from_tool_loop(
                 input_schema={"type": "object", "properties": {"query": {"type": "string"}}},
             )
         ],
-        call_result=(
-            "## ベクトル検索結果 (意味的類似度)\n\n"
-            "### Result 1 [distance=0.234]\n"
-            "Source: https://example.com/page1\n"
-            "関連テキスト"
-        ),
+        call_result=call_result,
     )
-    # rag_show_sources を有効にする
-    from unittest.mock import patch
-
-    mock_settings = MagicMock()
-    mock_settings.rag_show_sources = True
-
-    service = ChatService(
+    return ChatService(
         llm=mock_llm,
         session_factory=session_factory,
         mcp_manager=mock_mcp,
     )
 
-    with patch("src.services.chat.get_settings", return_value=mock_settings):
-        result = await service.respond("U001", "テスト質問", "ts_rag_001")
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("rag_show_sources_enabled")
+async def test_rag_sources_from_tool_loop(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """ツールループで rag_search が呼ばれた場合、ソースURLが抽出されること."""
+    service = _make_rag_search_service(
+        session_factory,
+        call_result=_RAG_VECTOR_RESULT,
+    )
+    result = await service.respond("U001", "テスト質問", "ts_rag_001")
 
     assert "参照元:" in result
     assert "[vector: distance=0.234]" in result
@@ -529,52 +534,78 @@ async def test_rag_sources_from_tool_loop(
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("rag_show_sources_enabled")
 async def test_rag_sources_bm25_format_in_output(
     session_factory: async_sessionmaker[AsyncSession],
 ) -> None:
     """ツールループで bm25 結果を含む場合、参照元に [bm25: score=X.XXX] が表示されること."""
-    tool_calls = [
-        ToolCall(id="call_1", name="rag_search", arguments={"query": "テスト"}),
-    ]
-    mock_llm = _make_mock_llm(
-        text_response="ナレッジベースによると...",
-        tool_calls=tool_calls,
+    service = _make_rag_search_service(
+        session_factory,
+        call_result=f"{_RAG_VECTOR_RESULT}\n\n{_RAG_BM25_RESULT}",
     )
-    mock_mcp = _make_mock_mcp_manager(
-        tools=[
-            ToolDefinition(
-                name="rag_search",
-                description="ナレッジベース検索",
-                input_schema={"type": "object", "properties": {"query": {"type": "string"}}},
-            )
-        ],
-        call_result=(
-            "## ベクトル検索結果 (意味的類似度)\n\n"
-            "### Result 1 [distance=0.234]\n"
-            "Source: https://example.com/page1\n"
-            "関連テキスト\n\n"
-            "## BM25検索結果 (キーワード一致)\n\n"
-            "### Result 1 [score=4.521]\n"
-            "Source: https://example.com/page2\n"
-            "BM25テキスト"
-        ),
+    result = await service.respond("U001", "テスト質問", "ts_rag_002")
+
+    assert "参照元:" in result
+    assert "[vector: distance=0.234]" in result
+    assert "[bm25: score=4.521]" in result
+    assert "https://example.com/page1" in result
+    assert "https://example.com/page2" in result
+
+
+@pytest.mark.asyncio
+async def test_auto_context_tools_called_concurrently(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """複数の auto_context_tool は並行実行され、結果は設定順に注入されること."""
+    barrier = asyncio.Barrier(2)
+
+    async def fake_call_tool(tool_name: str, arguments: dict[str, object]) -> str:
+        # 逐次実行だと2つ目の呼び出しが始まらず、待機がタイムアウトする
+        await asyncio.wait_for(barrier.wait(), timeout=1)
+        if tool_name == "search_a":
+            await asyncio.sleep(0.01)  # 後から完了しても注入順は設定順になる
+        return f"{tool_name} の結果"
+
+    mock_llm = _make_mock_llm(text_response="回答")
+    mock_mcp = _make_mock_mcp_manager()
+    mock_mcp.get_auto_context_tools = MagicMock(return_value=["search_a", "search_b"])
+    mock_mcp.call_tool = AsyncMock(side_effect=fake_call_tool)
+
+    service = ChatService(
+        llm=mock_llm,
+        session_factory=session_factory,
+        mcp_manager=mock_mcp,
     )
-    from unittest.mock import patch
 
-    mock_settings = MagicMock()
-    mock_settings.rag_show_sources = True
+    await service.respond("U001", "テスト", "ts_auto_001")
+
+    system_content = mock_llm.complete_with_tools.call_args[0][0][0].content
+    assert system_content.index("search_a の結果") < system_content.index("search_b の結果")
+
+
+@pytest.mark.asyncio
+async def test_auto_context_appended_to_system_prompt_with_instruction(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """auto_context の結果と response_instruction がシステムプロンプト末尾に順に追加されること."""
+    mock_llm = _make_mock_llm(text_response="回答")
+    mock_mcp = _make_mock_mcp_manager(call_result="検索結果テキスト")
+    mock_mcp.get_auto_context_tools = MagicMock(return_value=["rag_search"])
+    mock_mcp.get_response_instruction = MagicMock(return_value="出典を明記すること")
 
     service = ChatService(
         llm=mock_llm,
         session_factory=session_factory,
+        system_prompt="あなたはアシスタントです",
         mcp_manager=mock_mcp,
     )
 
-    with patch("src.services.chat.get_settings", return_value=mock_settings):
-        result = await service.respond("U001", "テスト質問", "ts_rag_002")
+    await service.respond("U001", "テスト", "ts_auto_002")
 
-    assert "参照元:" in result
-    assert "[vector: distance=0.234]" in result
-    assert "[bm25: score=4.521]" in result
-    assert "https://example.com/page1" in result
-    assert "https://example.com/page2" in result
+    system_content = mock_llm.complete_with_tools.call_args[0][0][0].content
+    assert system_content == (
+        "あなたはアシスタントです\n\n"
+        "以下は質問に関連する参考情報です。回答に役立つ場合は活用してください:\n"
+        "検索結果テキスト\n\n"
+        "出典を明記すること"
+    )
@@ -28,6 +28,16 @@ async def db_factory():  # type: ignore[no-untyped-def]
     await engine.dispose()
 
 
+@pytest.fixture(autouse=True)
+def _inline_to_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+    """asyncio.to_thread をスレッドを使わず同期実行に差し替える."""
+
+    async def _run(fn, *args):  # type: ignore[no-untyped-def]
+        return fn(*args)
+
+    monkeypatch.setattr("src.services.feed_collector.asyncio.to_thread", _run)
+
+
 def _make_parsed_feed(entries: list[dict]) -> MagicMock:  # type: ignore[type-arg]
     """feedparser.parse の戻り値をモックする."""
     mock = MagicMock()
@@ -53,8 +63,7 @@ async def test_rss_feed_is_fetched_and_parsed(db_factory) -> None:  # type: igno
     ])
 
     with patch("src.services.feed_collector.feedparser.parse", return_value=parsed):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            articles = await collector.collect_all()
+        articles = await collector.collect_all()
 
     assert len(articles) == 1
     assert articles[0].title == "Article 1"
@@ -80,8 +89,7 @@ async def test_duplicate_articles_skipped(db_factory) -> None:  # type: ignore[n
     ])
 
     with patch("src.services.feed_collector.feedparser.parse", return_value=parsed):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            articles = await collector.collect_all()
+        articles = await collector.collect_all()
 
     assert len(articles) == 1
     assert articles[0].url == "https://example.com/new"
@@ -99,8 +107,7 @@ async def test_articles_are_summarized_by_local_llm(db_factory) -> None:  # type
     ])
 
     with patch("src.services.feed_collector.feedparser.parse", return_value=parsed):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            await collector.collect_all()
+        await collector.collect_all()
 
     summarizer.summarize.assert_called_once_with("Test", "https://example.com/a", "記事の概要")
 
@@ -123,8 +130,7 @@ async def test_description_fallback_when_no_summary(db_factory) -> None:  # type
     ])
 
     with patch("src.services.feed_collector.feedparser.parse", return_value=parsed):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            await collector.collect_all()
+        await collector.collect_all()
 
     summarizer.summarize.assert_called_once_with("Desc Test", "https://example.com/desc", "descriptionの内容")
 
@@ -151,8 +157,7 @@ async def test_rss_failure_continues_other_feeds(db_factory) -> None:  # type: i
         return good_parsed
 
     with patch("src.services.feed_collector.feedparser.parse", side_effect=mock_parse):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            articles = await collector.collect_all()
+        articles = await collector.collect_all()
 
     # bad フィードが失敗しても good フィードの記事は収集される
     assert len(articles) == 1
@@ -178,8 +183,7 @@ async def test_ogp_extractor_integration(db_factory) -> None:  # type: ignore[no
     ])
 
     with patch("src.services.feed_collector.feedparser.parse", return_value=parsed):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            articles = await collector.collect_all()
+        articles = await collector.collect_all()
 
     assert len(articles) == 1
     assert articles[0].image_url == "https://example.com/img.png"
@@ -198,8 +202,7 @@ async def test_no_ogp_extractor_backward_compat(db_factory) -> None:  # type: ig
     ])
 
     with patch("src.services.feed_collector.feedparser.parse", return_value=parsed):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            articles = await collector.collect_all()
+        articles = await collector.collect_all()
 
     assert len(articles) == 1
     assert articles[0].image_url is None
@@ -427,8 +430,7 @@ async def test_fetch_feed_title_success(db_factory) -> None:  # type: ignore[no-
     mock_parsed.feed.get = lambda key, default="": {"title": "Python公式ブログ"}.get(key, default)
 
     with patch("src.services.feed_collector.feedparser.parse", return_value=mock_parsed):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            title = await collector.fetch_feed_title("https://example.com/rss")
+        title = await collector.fetch_feed_title("https://example.com/rss")
 
     assert title == "Python公式ブログ"
 
@@ -442,8 +444,7 @@ async def test_fetch_feed_title_fallback_to_url(db_factory) -> None:  # type: ig
     mock_parsed.feed.get = lambda key, default="": {"title": ""}.get(key, default)
 
     with patch("src.services.feed_collector.feedparser.parse", return_value=mock_parsed):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            title = await collector.fetch_feed_title("https://example.com/rss")
+        title = await collector.fetch_feed_title("https://example.com/rss")
 
     assert title == "https://example.com/rss"
 
@@ -457,8 +458,7 @@ async def test_fetch_feed_title_no_title_key(db_factory) -> None:  # type: ignor
     mock_parsed.feed.get = lambda key, default="": default
 
     with patch("src.services.feed_collector.feedparser.parse", return_value=mock_parsed):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            title = await collector.fetch_feed_title("https://example.com/rss")
+        title = await collector.fetch_feed_title("https://example.com/rss")
 
     assert title == "https://example.com/rss"
 
@@ -469,8 +469,7 @@ async def test_fetch_feed_title_parse_error(db_factory) -> None:  # type: ignore
     collector = FeedCollector(session_factory=db_factory, summarizer=summarizer)
 
     with patch("src.services.feed_collector.feedparser.parse", side_effect=Exception("Network error")):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            title = await collector.fetch_feed_title("https://example.com/rss")
+        title = await collector.fetch_feed_title("https://example.com/rss")
 
     assert title == "https://example.com/rss"
 
@@ -484,8 +483,7 @@ async def test_fetch_feed_title_strips_whitespace(db_factory) -> None:  # type:
     mock_parsed.feed.get = lambda key, default="": {"title": "  Python Blog  "}.get(key, default)
 
     with patch("src.services.feed_collector.feedparser.parse", return_value=mock_parsed):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            title = await collector.fetch_feed_title("https://example.com/rss")
+        title = await collector.fetch_feed_title("https://example.com/rss")
 
     assert title == "Python Blog"
 
@@ -634,8 +632,7 @@ async def test_collect_all_skip_summary(db_factory) -> None:  # type: ignore[no-
     ])
 
     with patch("src.services.feed_collector.feedparser.parse", return_value=parsed):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            articles = await collector.collect_all(skip_summary=True)
+        articles = await collector.collect_all(skip_summary=True)
 
     assert len(articles) == 2
 
@@ -655,8 +652,7 @@ async def test_skip_summary_no_llm_call(db_factory) -> None:  # type: ignore[no-
     ])
 
     with patch("src.services.feed_collector.feedparser.parse", return_value=parsed):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            await collector.collect_all(skip_summary=True)
+        await collector.collect_all(skip_summary=True)
 
     summarizer.summarize.assert_not_called()
 
@@ -671,8 +667,7 @@ async def test_skip_summary_delivered_default(db_factory) -> None:  # type: igno
     ])
 
     with patch("src.services.feed_collector.feedparser.parse", return_value=parsed):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            await collector.collect_all(skip_summary=True)
+        await collector.collect_all(skip_summary=True)
 
     async with db_factory() as session:
         result = await session.execute(
@@ -692,8 +687,7 @@ async def test_skip_summary_uses_description(db_factory) -> None:  # type: ignor
     ])
 
     with patch("src.services.feed_collector.feedparser.parse", return_value=parsed):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            await collector.collect_all(skip_summary=True)
+        await collector.collect_all(skip_summary=True)
 
     async with db_factory() as session:
         result = await session.execute(
@@ -713,8 +707,7 @@ async def test_skip_summary_placeholder_when_no_description(db_factory) -> None:
     ])
 
     with patch("src.services.feed_collector.feedparser.parse", return_value=parsed):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            await collector.collect_all(skip_summary=True)
+        await collector.collect_all(skip_summary=True)
 
     async with db_factory() as session:
         result = await session.execute(
@@ -736,8 +729,7 @@ async def test_skip_summary_then_normal_collect(db_factory) -> None:  # type: ig
     ])
 
     with patch("src.services.feed_collector.feedparser.parse", return_value=parsed1):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            await collector.collect_all(skip_summary=True)
+        await collector.collect_all(skip_summary=True)
 
     # 次に通常収集（新着 + 既存の混在フィード）
     parsed2 = _make_parsed_feed([
@@ -746,8 +738,7 @@ async def test_skip_summary_then_normal_collect(db_factory) -> None:  # type: ig
     ])
 
     with patch("src.services.feed_collector.feedparser.parse", return_value=parsed2):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            articles = await collector.collect_all()
+        articles = await collector.collect_all()
 
     # 新着記事のみ収集される
     assert len(articles) == 1
@@ -771,8 +762,7 @@ async def test_skip_summary_result_summary(db_factory) -> None:  # type: ignore[
     ])
 
     with patch("src.services.feed_collector.feedparser.parse", return_value=parsed):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            articles = await collector.collect_all(skip_summary=True)
+        articles = await collector.collect_all(skip_summary=True)
 
     assert len({a.feed_id for a in articles}) == 1
     assert len(articles) == 3
@@ -798,8 +788,7 @@ async def test_skip_summary_duplicate_skipped(db_factory) -> None:  # type: igno
     ])
 
     with patch("src.services.feed_collector.feedparser.parse", return_value=parsed):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            articles = await collector.collect_all(skip_summary=True)
+        articles = await collector.collect_all(skip_summary=True)
 
     assert len(articles) == 1
 
@@ -828,8 +817,7 @@ async def test_skip_summary_feed_failure_continues(db_factory) -> None:  # type:
         return good_parsed
 
     with patch("src.services.feed_collector.feedparser.parse", side_effect=mock_parse):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            articles = await collector.collect_all(skip_summary=True)
+        articles = await collector.collect_all(skip_summary=True)
 
     assert len(articles) == 1
 
@@ -851,8 +839,7 @@ async def test_skip_summary_with_ogp(db_factory) -> None:  # type: ignore[no-unt
     ])
 
     with patch("src.services.feed_collector.feedparser.parse", return_value=parsed):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            await collector.collect_all(skip_summary=True)
+        await collector.collect_all(skip_summary=True)
 
     async with db_factory() as session:
         result = await session.execute(
@@ -883,8 +870,7 @@ async def test_collect_feed_strips_html_from_description(db_factory) -> None:  #
     ])
 
     with patch("src.services.feed_collector.feedparser.parse", return_value=parsed):
-        with patch("src.services.feed_collector.asyncio.to_thread", side_effect=lambda fn, *a: fn(*a)):
-            await collector.collect_all()
+        await collector.collect_all()
 
     # summarizer に渡された description にHTMLタグが含まれないことを確認
     summarizer.summarize.assert_called_once()
@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
+import json
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
 from src.config.settings import DEFAULT_LMSTUDIO_BASE_URL, Settings
-from src.llm.base import LLMProvider
+from src.llm.anthropic_provider import (
+    AnthropicProvider,
+    _build_anthropic_messages,
+    _tool_def_to_anthropic,
+)
+from src.llm.base import LLMProvider, Message, ToolCall, ToolDefinition
 from src.llm.factory import create_local_provider, create_online_provider, get_provider_for_service
 from src.llm.lmstudio_provider import LMStudioProvider
+from src.llm.lmstudio_provider import _to_openai_message as _lmstudio_to_openai_message
+from src.llm.openai_provider import OpenAIProvider, _to_openai_message, _tool_def_to_openai
 
 
 def test_llm_provider_abc_has_complete() -> None:
@@ -22,9 +32,6 @@ def test_llm_provider_abc_has_complete() -> None:
 
 def test_three_providers_exist() -> None:
     """OpenAI/Anthropic/LM Studio の3プロバイダーが存在する."""
-    from src.llm.anthropic_provider import AnthropicProvider
-    from src.llm.openai_provider import OpenAIProvider
-
     assert issubclass(OpenAIProvider, LLMProvider)
     assert issubclass(AnthropicProvider, LLMProvider)
     assert issubclass(LMStudioProvider, LLMProvider)
@@ -50,7 +57,6 @@ def test_factory_creates_openai_provider(monkeypatch: pytest.MonkeyPatch) -> Non
     monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
     settings = Settings()
     provider = create_online_provider(settings)
-    from src.llm.openai_provider import OpenAIProvider
     assert isinstance(provider, OpenAIProvider)
 
 
@@ -60,7 +66,6 @@ def test_factory_creates_anthropic_provider(monkeypatch: pytest.MonkeyPatch) ->
     monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
     settings = Settings()
     provider = create_online_provider(settings)
-    from src.llm.anthropic_provider import AnthropicProvider
     assert isinstance(provider, AnthropicProvider)
 
 
@@ -86,7 +91,6 @@ def test_get_provider_for_service_returns_online_when_configured(
     monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
     settings = Settings()
     provider = get_provider_for_service(settings, "online")
-    from src.llm.openai_provider import OpenAIProvider
     assert isinstance(provider, OpenAIProvider)
 
 
@@ -119,9 +123,6 @@ def test_service_llm_settings_can_be_configured(monkeypatch: pytest.MonkeyPatch)
 
 def test_openai_message_role_mapping() -> None:
     """role ごとに正しい ChatCompletionMessageParam 型にマッピングされる."""
-    from src.llm.base import Message
-    from src.llm.openai_provider import _to_openai_message
-
     system_msg = _to_openai_message(Message(role="system", content="sys"))
     assert system_msg["role"] == "system"
 
@@ -134,11 +135,8 @@ def test_openai_message_role_mapping() -> None:
 
 def test_lmstudio_message_role_mapping() -> None:
     """LMStudio provider でも role が正しくマッピングされる."""
-    from src.llm.base import Message
-    from src.llm.lmstudio_provider import _to_openai_message
-
     for role in ("system", "user", "assistant"):
-        msg = _to_openai_message(Message(role=role, content="test"))  # type: ignore[arg-type]
+        msg = _lmstudio_to_openai_message(Message(role=role, content="test"))  # type: ignore[arg-type]
         assert msg["role"] == role
 
 
@@ -147,8 +145,6 @@ def test_lmstudio_message_role_mapping() -> None:
 
 def test_complete_with_tools_method_exists_and_tool_definition_is_constructable() -> None:
     """LLMProvider.complete_with_tools() が存在し、ToolDefinition を構築できること."""
-    from src.llm.base import ToolDefinition
-
     assert hasattr(LLMProvider, "complete_with_tools")
 
     # ToolDefinition が正しく構築できること
@@ -170,9 +166,6 @@ def test_complete_with_tools_method_exists_and_tool_definition_is_constructable(
 
 def test_openai_converts_tool_definition_and_tool_messages_to_openai_format() -> None:
     """OpenAIProvider が ToolDefinition と tool/assistant メッセージを OpenAI 形式に変換できること."""
-    from src.llm.base import Message, ToolCall, ToolDefinition
-    from src.llm.openai_provider import _to_openai_message, _tool_def_to_openai
-
     # ToolDefinition → OpenAI形式変換
     td = ToolDefinition(
         name="get_weather",
@@ -206,9 +199,6 @@ def test_openai_converts_tool_definition_and_tool_messages_to_openai_format() ->
 
 def test_anthropic_converts_tool_definition_and_tool_result_to_anthropic_format() -> None:
     """AnthropicProvider が ToolDefinition と tool_result メッセージを Anthropic 形式に変換できること."""
-    from src.llm.base import Message, ToolCall, ToolDefinition
-    from src.llm.anthropic_provider import _build_anthropic_messages, _tool_def_to_anthropic
-
     # ToolDefinition → Anthropic形式変換
     td = ToolDefinition(
         name="get_weather",
@@ -241,12 +231,6 @@ def test_anthropic_converts_tool_definition_and_tool_result_to_anthropic_format(
 @pytest.mark.asyncio
 async def test_lmstudio_complete_with_tools_returns_tool_call_response() -> None:
     """LMStudioProvider が Function Calling でツール呼び出し応答を返すこと."""
-    import json
-    from unittest.mock import AsyncMock, MagicMock
-
-    from src.llm.base import Message, ToolDefinition
-    from src.llm.lmstudio_provider import LMStudioProvider
-
     provider = LMStudioProvider(base_url=DEFAULT_LMSTUDIO_BASE_URL)
 
     # OpenAI互換APIのモックレスポンス（ツール呼び出しあり）
@@ -288,11 +272,6 @@ async def test_lmstudio_complete_with_tools_returns_tool_call_response() -> None
 @pytest.mark.asyncio
 async def test_lmstudio_complete_with_tools_returns_text_when_no_tool_call() -> None:
     """LMStudioProvider でツール呼び出しなしの場合、通常のテキスト応答を返すこと."""
-    from unittest.mock import AsyncMock, MagicMock
-
-    from src.llm.base import Message, ToolDefinition
-    from src.llm.lmstudio_provider import LMStudioProvider
-
     provider = LMStudioProvider(base_url=DEFAULT_LMSTUDIO_BASE_URL)
 
     # ツール呼び出しなしのモックレスポンス
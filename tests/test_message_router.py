@@ -232,6 +232,19 @@ async def test_feed_unknown_subcommand() -> None:
     assert "使用方法" in adapter.sent_messages[0][0]
 
 
+async def test_feed_prefix_word_is_not_feed_command() -> None:
+    """feed で始まる別の単語（feedback 等）は feed コマンドとして扱わない."""
+    collector = AsyncMock()
+    chat_service = AsyncMock()
+    chat_service.respond.return_value = "チャット応答"
+    adapter, router = _make_router(chat_service=chat_service, collector=collector)
+
+    await router.process_message(_make_msg("feedback ください"))
+
+    chat_service.respond.assert_called_once()
+    collector.list_feeds.assert_not_called()
+
+
 async def test_default_chat_response() -> None:
     """キーワードに一致しない場合は ChatService で応答."""
     chat_service = AsyncMock()
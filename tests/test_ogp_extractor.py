@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -10,18 +11,18 @@ import pytest
 from src.services.ogp_extractor import OgpExtractor
 
 
-async def test_extract_image_url_from_og_image_meta_tag() -> None:
-    """HTMLのog:imageメタタグからURLを取得できる."""
-    html = """
-    <html><head>
-    <meta property="og:image" content="https://example.com/img.png">
-    </head><body></body></html>
-    """
-    extractor = OgpExtractor()
-
+def _make_mock_session(
+    status: int,
+    html: str | None = None,
+    headers: dict[str, str] | None = None,
+) -> AsyncMock:
+    """指定ステータス・本文を返す aiohttp.ClientSession のモックを作成する."""
     mock_resp = AsyncMock()
-    mock_resp.status = 200
-    mock_resp.text = AsyncMock(return_value=html)
+    mock_resp.status = status
+    if html is not None:
+        mock_resp.text = AsyncMock(return_value=html)
+    if headers is not None:
+        mock_resp.headers = headers
     mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
     mock_resp.__aexit__ = AsyncMock(return_value=False)
 
@@ -29,73 +30,70 @@ async def test_extract_image_url_from_og_image_meta_tag() -> None:
     mock_session.get = MagicMock(return_value=mock_resp)
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=False)
-
-    with patch("src.services.ogp_extractor.aiohttp.ClientSession", return_value=mock_session):
-        result = await extractor.extract_image_url("https://example.com/article")
-
-    assert result == "https://example.com/img.png"
-
-
-async def test_extract_image_url_from_og_image_with_reversed_attributes() -> None:
-    """content属性がproperty属性の前にあるケースでも取得できる."""
-    html = '<html><head><meta content="https://img.com/a.jpg" property="og:image"></head></html>'
+    return mock_session
+
+
+@pytest.mark.parametrize(
+    ("html", "expected"),
+    [
+        pytest.param(
+            "<html><head>\n"
+            '<meta property="og:image" content="https://example.com/img.png">\n'
+            "</head><body></body></html>",
+            "https://example.com/img.png",
+            id="og_image_meta_tag",
+        ),
+        # content属性がproperty属性の前にあるケース
+        pytest.param(
+            '<html><head><meta content="https://img.com/a.jpg" property="og:image"></head></html>',
+            "https://img.com/a.jpg",
+            id="reversed_attributes",
+        ),
+    ],
+)
+async def test_extract_image_url_from_og_image(html: str, expected: str) -> None:
+    """HTMLのog:imageメタタグからURLを取得できる."""
     extractor = OgpExtractor()
-
-    mock_resp = AsyncMock()
-    mock_resp.status = 200
-    mock_resp.text = AsyncMock(return_value=html)
-    mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
-    mock_resp.__aexit__ = AsyncMock(return_value=False)
-
-    mock_session = AsyncMock()
-    mock_session.get = MagicMock(return_value=mock_resp)
-    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-    mock_session.__aexit__ = AsyncMock(return_value=False)
+    mock_session = _make_mock_session(200, html=html)
 
     with patch("src.services.ogp_extractor.aiohttp.ClientSession", return_value=mock_session):
         result = await extractor.extract_image_url("https://example.com/article")
 
-    assert result == "https://img.com/a.jpg"
+    assert result == expected
 
 
-async def test_extract_image_url_from_rss_media_content() -> None:
-    """RSSエントリのmedia_contentから画像URLを取得できる."""
-    extractor = OgpExtractor()
-    entry = {
-        "media_content": [{"url": "https://example.com/media.jpg", "type": "image/jpeg"}],
-    }
-    result = await extractor.extract_image_url("https://example.com/article", entry)
-    assert result == "https://example.com/media.jpg"
-
-
-async def test_extract_image_url_from_rss_enclosure() -> None:
-    """RSSエントリのenclosureから画像URLを取得できる."""
-    extractor = OgpExtractor()
-    entry = {
-        "enclosures": [{"href": "https://example.com/enc.png", "type": "image/png"}],
-    }
-    result = await extractor.extract_image_url("https://example.com/article", entry)
-    assert result == "https://example.com/enc.png"
-
-
-async def test_extract_image_url_from_rss_media_thumbnail() -> None:
-    """RSSエントリのmedia_thumbnailから画像URLを取得できる (Reddit等)."""
-    extractor = OgpExtractor()
-    entry = {
-        "media_thumbnail": [{"url": "https://reddit.com/thumb.jpg"}],
-    }
-    result = await extractor.extract_image_url("https://example.com/article", entry)
-    assert result == "https://reddit.com/thumb.jpg"
-
-
-async def test_extract_image_url_from_rss_summary_img_tag() -> None:
-    """RSSエントリのsummary内のimgタグから画像URLを取得できる (Medium等)."""
+@pytest.mark.parametrize(
+    ("entry", "expected"),
+    [
+        pytest.param(
+            {"media_content": [{"url": "https://example.com/media.jpg", "type": "image/jpeg"}]},
+            "https://example.com/media.jpg",
+            id="media_content",
+        ),
+        pytest.param(
+            {"enclosures": [{"href": "https://example.com/enc.png", "type": "image/png"}]},
+            "https://example.com/enc.png",
+            id="enclosure",
+        ),
+        # Reddit等
+        pytest.param(
+            {"media_thumbnail": [{"url": "https://reddit.com/thumb.jpg"}]},
+            "https://reddit.com/thumb.jpg",
+            id="media_thumbnail",
+        ),
+        # Medium等: summary内のimgタグ
+        pytest.param(
+            {"summary": '<p>Text</p><img src="https://cdn-images-1.medium.com/max/2600/img.jpg" />'},
+            "https://cdn-images-1.medium.com/max/2600/img.jpg",
+            id="summary_img_tag",
+        ),
+    ],
+)
+async def test_extract_image_url_from_rss_entry(entry: dict[str, Any], expected: str) -> None:
+    """RSSエントリの画像情報からURLを取得できる."""
     extractor = OgpExtractor()
-    entry = {
-        "summary": '<p>Text</p><img src="https://cdn-images-1.medium.com/max/2600/img.jpg" />',
-    }
     result = await extractor.extract_image_url("https://example.com/article", entry)
-    assert result == "https://cdn-images-1.medium.com/max/2600/img.jpg"
+    assert result == expected
 
 
 async def test_extract_image_url_returns_none_on_exception() -> None:
@@ -111,16 +109,7 @@ async def test_extract_image_url_returns_none_on_exception() -> None:
 async def test_extract_image_url_returns_none_on_non_200_status() -> None:
     """HTTP 200以外の場合はNoneを返す."""
     extractor = OgpExtractor()
-
-    mock_resp = AsyncMock()
-    mock_resp.status = 404
-    mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
-    mock_resp.__aexit__ = AsyncMock(return_value=False)
-
-    mock_session = AsyncMock()
-    mock_session.get = MagicMock(return_value=mock_resp)
-    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-    mock_session.__aexit__ = AsyncMock(return_value=False)
+    mock_session = _make_mock_session(404)
 
     with patch("src.services.ogp_extractor.aiohttp.ClientSession", return_value=mock_session):
         result = await extractor.extract_image_url("https://example.com/article")
@@ -134,17 +123,9 @@ async def test_extract_image_url_returns_none_on_redirect_for_ssrf_protection(
 ) -> None:
     """リダイレクト応答時はSSRF対策としてNoneを返しwarningログを出す."""
     extractor = OgpExtractor()
-
-    mock_resp = AsyncMock()
-    mock_resp.status = status_code
-    mock_resp.headers = {"Location": "http://internal-server/secret"}
-    mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
-    mock_resp.__aexit__ = AsyncMock(return_value=False)
-
-    mock_session = AsyncMock()
-    mock_session.get = MagicMock(return_value=mock_resp)
-    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-    mock_session.__aexit__ = AsyncMock(return_value=False)
+    mock_session = _make_mock_session(
+        status_code, headers={"Location": "http://internal-server/secret"}
+    )
 
     with (
         patch(
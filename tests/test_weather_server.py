@@ -7,10 +7,13 @@
 from __future__ import annotations
 
 import json
+from importlib import import_module
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+_weather_server = import_module("mcp_servers.weather.server")
+
 
 def _make_area_response() -> bytes:
     """気象庁 area.json のモックレスポンスを生成する."""
@@ -116,10 +119,7 @@ def _mock_urlopen_factory(
 
 def _reset_office_map() -> None:
     """テスト間で _office_map をリセットする."""
-    from importlib import import_module
-
-    mod = import_module("mcp_servers.weather.server")
-    mod._office_map.clear()
+    _weather_server._office_map.clear()
 
 
 @pytest.fixture(autouse=True)
@@ -131,10 +131,7 @@ def _clear_cache() -> None:
 @pytest.mark.asyncio
 async def test_weather_server_exposes_tool() -> None:
     """天気予報MCPサーバーが起動し、get_weather ツールを公開すること."""
-    from importlib import import_module
-
-    mod = import_module("mcp_servers.weather.server")
-    server = mod.mcp
+    server = _weather_server.mcp
 
     tools = await server.list_tools()
     tool_names = [t.name for t in tools]
@@ -144,10 +141,7 @@ async def test_weather_server_exposes_tool() -> None:
 @pytest.mark.asyncio
 async def test_get_weather_returns_forecast_today() -> None:
     """get_weather ツールが今日の天気予報テキストを返すこと."""
-    from importlib import import_module
-
-    mod = import_module("mcp_servers.weather.server")
-    get_weather = mod.get_weather
+    get_weather = _weather_server.get_weather
 
     mock_urlopen = _mock_urlopen_factory()
 
@@ -163,10 +157,7 @@ async def test_get_weather_returns_forecast_today() -> None:
 @pytest.mark.asyncio
 async def test_get_weather_returns_forecast_tomorrow() -> None:
     """get_weather ツールが明日の天気予報テキストを返すこと."""
-    from importlib import import_module
-
-    mod = import_module("mcp_servers.weather.server")
-    get_weather = mod.get_weather
+    get_weather = _weather_server.get_weather
 
     mock_urlopen = _mock_urlopen_factory()
 
@@ -180,10 +171,7 @@ async def test_get_weather_returns_forecast_tomorrow() -> None:
 @pytest.mark.asyncio
 async def test_get_weather_returns_week_forecast() -> None:
     """get_weather ツールが週間予報テキストを返すこと."""
-    from importlib import import_module
-
-    mod = import_module("mcp_servers.weather.server")
-    get_weather = mod.get_weather
+    get_weather = _weather_server.get_weather
 
     mock_urlopen = _mock_urlopen_factory()
 
@@ -199,10 +187,7 @@ async def test_get_weather_returns_week_forecast() -> None:
 @pytest.mark.asyncio
 async def test_jma_api_called_correctly() -> None:
     """気象庁APIの正しいエンドポイントが呼ばれること."""
-    from importlib import import_module
-
-    mod = import_module("mcp_servers.weather.server")
-    get_weather = mod.get_weather
+    get_weather = _weather_server.get_weather
 
     mock_urlopen = _mock_urlopen_factory()
 
@@ -226,10 +211,7 @@ async def test_jma_api_called_correctly() -> None:
 @pytest.mark.asyncio
 async def test_location_not_found() -> None:
     """存在しない地域名の場合、エラーメッセージを返すこと."""
-    from importlib import import_module
-
-    mod = import_module("mcp_servers.weather.server")
-    get_weather = mod.get_weather
+    get_weather = _weather_server.get_weather
 
     mock_urlopen = _mock_urlopen_factory()
 
@@ -242,10 +224,7 @@ async def test_location_not_found() -> None:
 @pytest.mark.asyncio
 async def test_city_name_fallback() -> None:
     """主要都市名（札幌など）でフォールバック検索が機能すること."""
-    from importlib import import_module
-
-    mod = import_module("mcp_servers.weather.server")
-    get_weather = mod.get_weather
+    get_weather = _weather_server.get_weather
 
     mock_urlopen = _mock_urlopen_factory()
 
@@ -260,10 +239,7 @@ async def test_city_name_fallback() -> None:
 @pytest.mark.asyncio
 async def test_umbrella_recommendation_rain() -> None:
     """天気に「雨」が含まれる場合、傘の推奨メッセージが出ること."""
-    from importlib import import_module
-
-    mod = import_module("mcp_servers.weather.server")
-    get_weather = mod.get_weather
+    get_weather = _weather_server.get_weather
 
     rainy_forecast = _make_forecast_response(
         weathers=["雨　時々　くもり", "くもり", "晴れ"],
@@ -280,10 +256,7 @@ async def test_umbrella_recommendation_rain() -> None:
 @pytest.mark.asyncio
 async def test_invalid_date_parameter() -> None:
     """無効な日付パラメータの場合、エラーメッセージを返すこと."""
-    from importlib import import_module
-
-    mod = import_module("mcp_servers.weather.server")
-    get_weather = mod.get_weather
+    get_weather = _weather_server.get_weather
 
     mock_urlopen = _mock_urlopen_factory()
 